@@ -7,16 +7,21 @@ import sys
 import time
 import random
 import os
+import re
 import json
 import shutil
+import signal
 import platform
+from collections import deque
 from enum import Enum
+from itertools import islice
 from datetime import datetime
 
 # Platform-specific imports
 try:
     import termios
     import tty
+    import select
     UNIX_TERMINAL = True
 except ImportError:
     UNIX_TERMINAL = False
@@ -31,6 +36,26 @@ if platform.system() == 'Windows':
 else:
     WINDOWS_TERMINAL = False
 
+# Scheduler wakeups are only accurate to a few milliseconds, so the game loop
+# sleeps until this long before a tick and spins through the rest
+_JAM = 0.002
+
+# Cursor home + clear screen + clear scrollback, matching what clear/cls did
+# without forking a process
+_CLEAR = "\x1b[H\x1b[2J\x1b[3J"
+
+# Synchronized output (DEC mode 2026): the terminal holds its repaint until the
+# end marker, so a frame never shows half drawn
+SYNC_BEGIN = b"\x1b[?2026h"
+SYNC_END = b"\x1b[?2026l"
+
+# Terminal types from detect_terminal_type known to support synchronized output;
+# SNAKE_SYNC_OUTPUT=1 or 0 in the environment overrides the detection either way
+SYNC_TERMINALS = {'iterm2', 'vscode', 'wezterm', 'kitty', 'ghostty', 'windows_terminal'}
+
+# ANSI color codes, stripped when measuring the visible width of a line
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
 class Colors:
     """Terminal colors"""
     RESET = '\033[0m'
@@ -55,6 +80,9 @@ class Colors:
     BLINK = '\033[5m'
     REVERSE = '\033[7m'
     
+    # Color cycle for rainbow effects
+    RAINBOW = (RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA)
+    
     @classmethod
     def color(cls, text, color):
         return f"{color}{text}{cls.RESET}"
@@ -62,7 +90,7 @@ class Colors:
     @classmethod
     def rainbow_text(cls, text):
         """Create rainbow effect for special occasions"""
-        colors = [cls.RED, cls.YELLOW, cls.GREEN, cls.CYAN, cls.BLUE, cls.MAGENTA]
+        colors = cls.RAINBOW
         result = ""
         for i, char in enumerate(text):
             if char != ' ':
@@ -71,20 +99,76 @@ class Colors:
                 result += char
         return result
 
+# Board glyphs with their colors, encoded once for the frame buffer
+GLYPHS = {
+    'wall': Colors.color("#", Colors.GRAY).encode(),
+    'corner': Colors.color("+", Colors.WHITE + Colors.BOLD).encode(),
+    'head': Colors.color("@", Colors.GREEN + Colors.BOLD).encode(),
+    'head_l5': Colors.color("@", Colors.GREEN + Colors.BG_GREEN + Colors.BOLD).encode(),
+    'body_bright': Colors.color("o", Colors.GREEN + Colors.BOLD).encode(),
+    'body': Colors.color("o", Colors.GREEN).encode(),
+    'food': Colors.color("*", Colors.RED + Colors.BOLD).encode(),
+    'empty': b" ",
+}
+
+# Rainbow food, one glyph per color, cycled every tick at higher levels
+RAINBOW_STAR = tuple(Colors.color("*", color).encode() for color in Colors.RAINBOW)
+
+# Rainbow game over title for high scores
+GAME_OVER_RAINBOW = Colors.rainbow_text("GAME OVER!")
+
 class Direction(Enum):
     UP = (-1, 0)
     DOWN = (1, 0)
     LEFT = (0, -1)
     RIGHT = (0, 1)
 
+# Direction that would reverse into the snake's own neck
+OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
+
+# Final byte of the ESC [ sequence sent by each arrow key (Unix/Mac)
+ARROW_KEYS = {
+    ord('A'): Direction.UP,
+    ord('B'): Direction.DOWN,
+    ord('C'): Direction.RIGHT,
+    ord('D'): Direction.LEFT
+}
+
+# Second byte after the 224 prefix for Windows arrow keys
+WINDOWS_ARROW_KEYS = {
+    72: Direction.UP,
+    80: Direction.DOWN,
+    77: Direction.RIGHT,
+    75: Direction.LEFT
+}
+
 class TerminalUtils:
     @staticmethod
     def clear_screen():
         """Cross-platform screen clear"""
-        if platform.system() == 'Windows':
-            os.system('cls')
-        else:
-            os.system('clear')
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
+    
+    @staticmethod
+    def enable_ansi():
+        """Enable ANSI escape processing in the Windows console"""
+        if platform.system() != 'Windows':
+            return
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+        except (AttributeError, OSError):
+            pass
     
     @staticmethod
     def get_terminal_size():
@@ -95,6 +179,18 @@ class TerminalUtils:
         except:
             return 80, 24
     
+    @staticmethod
+    def visible_len(text):
+        """Length of text as displayed, ignoring ANSI color codes"""
+        if '\x1b' not in text:
+            return len(text)
+        return len(_ANSI_RE.sub('', text))
+    
+    @staticmethod
+    def center_line(line, visible_len, width):
+        """Center a single line whose visible length is already known"""
+        return ' ' * max(0, (width - visible_len) // 2) + line
+    
     @staticmethod
     def center_text(text, width=None):
         """Center text in terminal, properly handling ANSI color codes"""
@@ -104,9 +200,7 @@ class TerminalUtils:
         centered_lines = []
         for line in lines:
             # Remove ANSI color codes for accurate length calculation
-            import re
-            clean_line = re.sub(r'\x1b\[[0-9;]*m', '', line)
-            padding = max(0, (width - len(clean_line)) // 2)
+            padding = max(0, (width - TerminalUtils.visible_len(line)) // 2)
             # Add padding only to the left, preserving the original line structure
             centered_lines.append(' ' * padding + line)
         return '\n'.join(centered_lines)
@@ -119,26 +213,118 @@ class TerminalUtils:
         centered_lines = []
         for line in lines:
             # Remove ANSI color codes for length calculation
-            import re
-            clean_line = re.sub(r'\x1b\[[0-9;]*m', '', line)
-            padding = max(0, (width - len(clean_line)) // 2)
+            padding = max(0, (width - TerminalUtils.visible_len(line)) // 2)
             centered_lines.append(' ' * padding + line)
         return centered_lines
 
+# In-game header lines with colors baked in; only the numbers are filled in
+_HEADER_TEMPLATES = (
+    "| " + Colors.color("Score: {}", Colors.YELLOW + Colors.BOLD) +
+    " | " + Colors.color("Level: {}", Colors.CYAN + Colors.BOLD) +
+    " | " + Colors.color("Foods: {}", Colors.GREEN) + " |",
+    "| " + Colors.color("Length: {}", Colors.MAGENTA) +
+    " | " + Colors.color("Q: Quit", Colors.RED + Colors.DIM) + " |",
+)
+# (template, visible width without the numbers)
+HEADER_LINES = tuple(
+    (template, TerminalUtils.visible_len(template) - 2 * template.count("{}"))
+    for template in _HEADER_TEMPLATES
+)
+
+# Footer tips with their colors, in the order draw_board selects them
+TIPS = (
+    ("TIP: Eat food (*) to grow and score points!", Colors.CYAN + Colors.DIM),
+    ("AWESOME: Rainbow food gives bonus points!", Colors.MAGENTA + Colors.DIM),
+    ("CAREFUL: Don't hit your own tail!", Colors.YELLOW + Colors.DIM),
+    ("Arrow keys: Move | Q: Quit", Colors.WHITE + Colors.DIM),
+)
+
+# Game over box; colored lines are pre-centered, stats are centered by the format spec
+GAME_OVER_WIDTH = 50
+
+def _center_colored(text, colored, width=GAME_OVER_WIDTH):
+    """Center text within width, then swap in its colored version"""
+    return format(text, f'^{width}').replace(text, colored, 1)
+
+GAME_OVER_TITLES = {
+    False: _center_colored("GAME OVER!", Colors.color("GAME OVER!", Colors.RED + Colors.BOLD)),
+    True: _center_colored("GAME OVER!", GAME_OVER_RAINBOW),
+}
+# (minimum score, verdict), best first
+GAME_OVER_VERDICTS = tuple(
+    (min_score, _center_colored(text, Colors.color(text, color)))
+    for min_score, text, color in (
+        (200, "INCREDIBLE SCORE!", Colors.YELLOW + Colors.BOLD),
+        (100, "Great job!", Colors.GREEN + Colors.BOLD),
+        (50, "Not bad!", Colors.CYAN),
+        (0, "Keep practicing!", Colors.BLUE),
+    )
+)
+GAME_OVER_TMPL = "\n".join("{pad}" + line for line in (
+    "+" + "=" * GAME_OVER_WIDTH + "+",
+    "|{title}|",
+    "+" + "-" * GAME_OVER_WIDTH + "+",
+    "|" + " " * GAME_OVER_WIDTH + "|",
+    "|{score:^{w}}|",
+    "|{level:^{w}}|",
+    "|{foods:^{w}}|",
+    "|{length:^{w}}|",
+    "|" + " " * GAME_OVER_WIDTH + "|",
+    "|{performance}|",
+    "|" + " " * GAME_OVER_WIDTH + "|",
+    "|" + format("Press 'y' to play again, 'n' to quit", f'^{GAME_OVER_WIDTH}') + "|",
+    "+" + "=" * GAME_OVER_WIDTH + "+",
+))
+
+# Difficulty settings with dynamic sizing; the board shrinks to fit the terminal
+DIFFICULTIES = {
+    'easy': {'base_size': (35, 30), 'speed': 0.15},
+    'medium': {'base_size': (45, 40), 'speed': 0.1},
+    'hard': {'base_size': (55, 50), 'speed': 0.05}
+}
+
 class SnakeGame:
     def __init__(self, difficulty='medium'):
-        # Get terminal dimensions
-        self.term_width, self.term_height = TerminalUtils.get_terminal_size()
+        # Each frame is written into a preallocated buffer at self.frame_len, so
+        # steady-state rendering does not allocate or resize it
+        self.frame_buf = bytearray(64 * 1024)
+        self.frame_len = 0
+        try:
+            self.out_fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self.out_fd = None
+        self.input_buf = bytearray()  # Raw key bytes not yet parsed
+        
+        # Detect terminal type for better speed compensation
+        self.terminal_type = self.detect_terminal_type()
+        sync_setting = os.environ.get('SNAKE_SYNC_OUTPUT', '').strip()
+        if sync_setting in ('0', '1'):
+            # Manual override, e.g. GNU screen inside iTerm2 or an unlisted terminal
+            self.sync_output = sync_setting == '1'
+        else:
+            self.sync_output = self.terminal_type in SYNC_TERMINALS
+        
+        # Universal speed compensation for cross-platform compatibility
+        # Most terminals have character aspect ratio between 1.6:1 to 2.2:1 (height:width)
+        # Use conservative ratio that works well across different systems
+        horizontal_ratio = 0.7  # Make horizontal movement faster
         
-        # Difficulty settings with dynamic sizing
-        base_difficulties = {
-            'easy': {'base_size': (35, 30), 'speed': 0.15},
-            'medium': {'base_size': (45, 40), 'speed': 0.1},
-            'hard': {'base_size': (55, 50), 'speed': 0.05}
+        self.speed_ratios = {
+            Direction.UP: 1.0,              # Vertical movement (normal speed)
+            Direction.DOWN: 1.0,            # Vertical movement (normal speed)
+            Direction.LEFT: horizontal_ratio,   # Horizontal movement (compensated)
+            Direction.RIGHT: horizontal_ratio   # Horizontal movement (compensated)
         }
         
+        self.reset(difficulty)
+
+    def reset(self, difficulty='medium'):
+        """Start a new game, reusing this instance's buffers"""
+        # Get terminal dimensions
+        self.term_width, self.term_height = TerminalUtils.get_terminal_size()
+        
         # Adjust board size to fit terminal
-        base_height, base_width = base_difficulties[difficulty]['base_size']
+        base_height, base_width = DIFFICULTIES[difficulty]['base_size']
         
         # Calculate maximum board size that fits in terminal
         max_width = min(self.term_width - 10, base_width)  # Leave margin for borders
@@ -148,40 +334,57 @@ class SnakeGame:
         self.width = max(20, max_width)
         self.height = max(10, max_height)
         
-        self.base_speed = base_difficulties[difficulty]['speed']
+        self.base_speed = DIFFICULTIES[difficulty]['speed']
         self.score = 0
         self.running = True
         self.foods_eaten = 0
         self.level = 1
         self.last_score_milestone = 0
         
-        # Detect terminal type for better speed compensation
-        self.terminal_type = self.detect_terminal_type()
-        
-        # Universal speed compensation for cross-platform compatibility
-        # Most terminals have character aspect ratio between 1.6:1 to 2.2:1 (height:width)
-        # Use conservative ratio that works well across different systems
-        horizontal_ratio = 0.7  # Make horizontal movement faster
-        
-        self.speed_ratios = {
-            Direction.UP: 1.0,              # Vertical movement (normal speed)
-            Direction.DOWN: 1.0,            # Vertical movement (normal speed)
-            Direction.LEFT: horizontal_ratio,   # Horizontal movement (compensated)
-            Direction.RIGHT: horizontal_ratio   # Horizontal movement (compensated)
-        }
-        
         # Snake starts in center
         center_y, center_x = self.height // 2, self.width // 2
-        self.snake = [(center_y, center_x), (center_y, center_x - 1), (center_y, center_x - 2)]
-        self.direction = Direction.RIGHT
+        self.snake = deque([(center_y, center_x), (center_y, center_x - 1), (center_y, center_x - 2)])
+        self.snake_set = set(self.snake)  # O(1) occupancy checks alongside the ordered body
+        self.set_direction(Direction.RIGHT)
         self.next_direction = Direction.RIGHT
         
+        # Interior cells not covered by the snake; the index map allows O(1) removal
+        self.free_cells = [(y, x) for y in range(1, self.height - 1) for x in range(1, self.width - 1)
+                           if (y, x) not in self.snake_set]
+        self.free_index = {pos: i for i, pos in enumerate(self.free_cells)}
+        
         # Generate first food
         self.food = self.generate_food()
         
-        # Terminal setup (cross-platform)
+        # Screen layout for the differential renderer; recomputed on terminal resize
+        self.reset_layout()
+        self.layout_dirty = False
+        self.old_winch_handler = None
+        self.game_screen = False
+        self.frame_len = 0
+        self.ticks = 0
+        del self.input_buf[:]
+        
+        self.setup_terminal()
+
+    def setup_terminal(self):
+        """Put stdin into cbreak mode with non-blocking reads for the game (cross-platform)"""
         self.old_settings = None
+        self.raw_reads = False
         self.terminal_mode = False
+        self.input_closed = False
+        try:
+            self.in_fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            self.in_fd = None
+            self.input_closed = True
+        
+        # stdin is registered with a poll object once instead of building select's
+        # fd lists on every wait; macOS poll() does not support terminals, so it keeps select
+        self.poller = None
+        if UNIX_TERMINAL and self.in_fd is not None and hasattr(select, 'poll') and sys.platform != 'darwin':
+            self.poller = select.poll()
+            self.poller.register(self.in_fd, select.POLLIN)
         
         if UNIX_TERMINAL:
             try:
@@ -190,10 +393,58 @@ class SnakeGame:
                 self.terminal_mode = True
             except (termios.error, OSError):
                 pass
+            if self.terminal_mode:
+                # VMIN=0/VTIME=0 makes a read return whatever is pending, possibly nothing,
+                # so get_key_press can drain input without a poll first. Unlike O_NONBLOCK
+                # this is a tty input setting and leaves writes to the shared terminal blocking
+                try:
+                    attrs = termios.tcgetattr(self.in_fd)
+                    attrs[6][termios.VMIN] = 0
+                    attrs[6][termios.VTIME] = 0
+                    termios.tcsetattr(self.in_fd, termios.TCSANOW, attrs)
+                    self.raw_reads = True
+                except (termios.error, OSError):
+                    pass
         elif WINDOWS_TERMINAL:
             # Windows terminal is ready by default for getch
             self.terminal_mode = True
 
+    def reset_layout(self):
+        """Position the board for the current terminal size and schedule a full repaint"""
+        # Board cell (y, x) is drawn at row self.row_off + y, column self.col_off + x (1-based)
+        self.board_top = max(0, (self.term_height - (self.height + 5)) // 2 - 2) + 1
+        self.row_off = self.board_top + 3
+        self.col_off = max(0, (self.term_width - (self.width + 2)) // 2) + 2
+        # Cursor-position sequence for every board cell, so redraws only index into it
+        self.cell_goto = [[f"\x1b[{self.row_off + y};{self.col_off + x}H".encode() for x in range(self.width)]
+                          for y in range(self.height)]
+        
+        # What is currently on screen, plus the cells that may have changed since
+        self.prev_cells = [[GLYPHS['empty']] * self.width for _ in range(self.height)]
+        self.dirty_cells = set(self.snake)
+        self.dirty_cells.add(self.food)
+        self.screen_ready = False
+        self.last_header1 = None
+        self.last_header2 = None
+        self.last_tip = None
+        
+        # Footer tips never change, so each one is centered and encoded up front
+        footer_row = self.row_off + self.height + 1
+        self.footer_lines = []
+        for tip_text, tip_color in TIPS:
+            tip = Colors.color(tip_text, tip_color)
+            tip_padding = max(0, (self.width - 2 - len(tip_text)) // 2)  # -2 for the border characters
+            tail_padding = max(0, self.width - 2 - len(tip_text) - tip_padding)
+            footer = "|" + " " * tip_padding + tip + " " * tail_padding + "|"
+            footer_len = tip_padding + len(tip_text) + tail_padding + 2
+            centered_footer = TerminalUtils.center_line(footer, footer_len, self.term_width)
+            self.footer_lines.append(f"\x1b[{footer_row};1H\x1b[2K{centered_footer}".encode())
+
+    def on_resize(self, signum, frame):
+        """SIGWINCH handler: refresh the cached terminal size"""
+        self.term_width, self.term_height = TerminalUtils.get_terminal_size()
+        self.layout_dirty = True
+
     def detect_terminal_type(self):
         """Detect terminal type for cross-platform compatibility"""
         term_program = os.environ.get('TERM_PROGRAM', '').lower()
@@ -205,51 +456,59 @@ class SnakeGame:
             return 'terminal'
         elif 'vscode' in term_program:
             return 'vscode'
+        elif 'wezterm' in term_program:
+            return 'wezterm'
+        elif 'ghostty' in term_program:
+            return 'ghostty'
+        elif 'kitty' in term:
+            return 'kitty'
+        elif os.environ.get('WT_SESSION'):
+            return 'windows_terminal'
         elif 'screen' in term or 'tmux' in os.environ.get('TMUX', ''):
             return 'generic'
         else:
             return 'generic'
 
+    def occupy_cell(self, pos):
+        """Remove a cell from the free pool in O(1) by swapping in the last entry"""
+        index = self.free_index.pop(pos)
+        last = self.free_cells.pop()
+        if last != pos:
+            self.free_cells[index] = last
+            self.free_index[last] = index
+
+    def release_cell(self, pos):
+        """Return a cell to the free pool"""
+        self.free_index[pos] = len(self.free_cells)
+        self.free_cells.append(pos)
+
     def generate_food(self):
         """Generate food with improved positioning - avoid walls and snake body"""
-        attempts = 0
-        max_attempts = 100
+        if not self.free_cells:
+            return None  # The snake fills the whole board
         
-        # Define safe zone boundaries (avoid too close to walls)
+        # Define safe zone boundaries (avoid too close to side walls)
         wall_margin = 2
-        vertical_margin = 1  # Reduced margin for top/bottom
-        safe_top = vertical_margin
-        safe_bottom = self.height - vertical_margin - 1
-        safe_left = wall_margin  
+        safe_left = wall_margin
         safe_right = self.width - wall_margin - 1
+        head_y, head_x = self.snake[0]
         
-        while attempts < max_attempts:
-            # Try to place food in safe zone first
-            if attempts < max_attempts // 2:
-                food_y = random.randint(safe_top, safe_bottom)
-                food_x = random.randint(safe_left, safe_right)
-            else:
-                # Fallback to original method if safe zone fails
-                food_y = random.randint(1, self.height - 2)
-                food_x = random.randint(1, self.width - 2)
-            
-            food_pos = (food_y, food_x)
-            
-            # Check if position is valid (not in snake and not too close to snake head)
-            if food_pos not in self.snake:
+        # Every candidate is free, so only the placement preferences need a retry
+        max_attempts = 5
+        for _ in range(max_attempts):
+            food_pos = random.choice(self.free_cells)
+            food_y, food_x = food_pos
+            if safe_left <= food_x <= safe_right:
                 # Additional check: not too close to snake head for better gameplay
-                head_y, head_x = self.snake[0]
                 distance = abs(food_y - head_y) + abs(food_x - head_x)
                 if distance >= 3:  # Manhattan distance of at least 3
                     return food_pos
-            
-            attempts += 1
         
-        # Emergency fallback - just avoid snake body
-        while True:
-            food_pos = (random.randint(1, self.height - 2), random.randint(1, self.width - 2))
-            if food_pos not in self.snake:
-                return food_pos
+        # Fallback for crowded boards: choose among the free cells that still meet the
+        # preferences, dropping the wall margin and then the head distance only if none do
+        far = [pos for pos in self.free_cells if abs(pos[0] - head_y) + abs(pos[1] - head_x) >= 3]
+        safe = [pos for pos in far if safe_left <= pos[1] <= safe_right]
+        return random.choice(safe or far or self.free_cells)
 
     def get_key_press(self):
         """Cross-platform non-blocking key input"""
@@ -262,14 +521,26 @@ class SnakeGame:
                 return key
             return None
         elif UNIX_TERMINAL:
-            # Unix/Linux/macOS implementation
-            try:
-                import select
-                if select.select([sys.stdin], [], [], 0.0)[0]:
-                    return sys.stdin.read(1)
-            except ImportError:
-                pass
-            return None
+            # Unix/Linux/macOS implementation: drain everything pending
+            if self.input_closed:
+                return None
+            chunks = []
+            while True:
+                try:
+                    # Blocking stdin: only read while a read won't block
+                    if not self.raw_reads and not self.input_ready(0.0):
+                        break
+                    data = os.read(self.in_fd, 64)
+                except OSError:
+                    break  # stdin went away
+                if not data:
+                    if not self.raw_reads:
+                        self.input_closed = True  # EOF: stop waiting on stdin
+                    break  # With VMIN=0 an empty read just means nothing is pending
+                chunks.append(data)
+                if self.raw_reads and len(data) < 64:
+                    break  # Short read: nothing else is pending
+            return b"".join(chunks) or None
         else:
             # Fallback - blocking input (not ideal but works)
             try:
@@ -278,6 +549,30 @@ class SnakeGame:
             except (EOFError, KeyboardInterrupt):
                 return None
 
+    def turn(self, direction):
+        """Queue a direction change unless it would reverse the snake"""
+        if direction is not None and self.direction != OPPOSITE[direction]:
+            self.next_direction = direction
+
+    def parse_keys(self):
+        """Apply complete key sequences from the input buffer, keeping a trailing partial one"""
+        buf = self.input_buf
+        i = 0
+        while i < len(buf):
+            if buf[i] == 0x1b:  # ESC
+                if i + 1 < len(buf) and buf[i + 1] != 0x5b:  # Lone ESC, not an arrow
+                    i += 1
+                    continue
+                if i + 2 >= len(buf):
+                    break  # Rest of the sequence has not arrived yet
+                self.turn(ARROW_KEYS.get(buf[i + 2]))
+                i += 3
+            else:
+                if buf[i] in b'qQ':
+                    self.running = False
+                i += 1
+        del buf[:i]
+
     def handle_input(self):
         key = self.get_key_press()
         if key:
@@ -285,48 +580,38 @@ class SnakeGame:
                 # Windows special key prefix
                 key2 = self.get_key_press()
                 if key2:
-                    if ord(key2) == 72 and self.direction != Direction.DOWN:  # Up arrow
-                        self.next_direction = Direction.UP
-                    elif ord(key2) == 80 and self.direction != Direction.UP:  # Down arrow
-                        self.next_direction = Direction.DOWN
-                    elif ord(key2) == 77 and self.direction != Direction.LEFT:  # Right arrow
-                        self.next_direction = Direction.RIGHT
-                    elif ord(key2) == 75 and self.direction != Direction.RIGHT:  # Left arrow
-                        self.next_direction = Direction.LEFT
-            elif key == '\x1b':  # ESC sequence (Unix/Mac)
-                if UNIX_TERMINAL:
-                    key2 = sys.stdin.read(1)
-                    if key2 == '[':
-                        key3 = sys.stdin.read(1)
-                        if key3 == 'A' and self.direction != Direction.DOWN:
-                            self.next_direction = Direction.UP
-                        elif key3 == 'B' and self.direction != Direction.UP:
-                            self.next_direction = Direction.DOWN
-                        elif key3 == 'C' and self.direction != Direction.LEFT:
-                            self.next_direction = Direction.RIGHT
-                        elif key3 == 'D' and self.direction != Direction.RIGHT:
-                            self.next_direction = Direction.LEFT
+                    self.turn(WINDOWS_ARROW_KEYS.get(ord(key2)))
+            elif UNIX_TERMINAL:
+                # Several keys may arrive in one read; arrows are ESC [ A..D sequences
+                self.input_buf += key
+                self.parse_keys()
             elif key.lower() == 'q':
                 self.running = False
 
     def move_snake(self):
-        self.direction = self.next_direction
+        self.ticks += 1
+        if self.next_direction is not self.direction:
+            self.set_direction(self.next_direction)
         head = self.snake[0]
-        dy, dx = self.direction.value
-        new_head = (head[0] + dy, head[1] + dx)
+        ny = head[0] + self.dy
+        nx = head[1] + self.dx
+        new_head = (ny, nx)
         
         # Check wall collision (walls are at 0 and height-1, width-1)
-        if (new_head[0] < 1 or new_head[0] >= self.height - 1 or 
-            new_head[1] < 1 or new_head[1] >= self.width - 1):
+        if not (0 < ny < self.height - 1 and 0 < nx < self.width - 1):
             # Show wall collision explosion effect
             self.wall_collision_effect(new_head)
             return False
         
         # Check self collision
-        if new_head in self.snake:
+        if new_head in self.snake_set:
             return False
         
-        self.snake.insert(0, new_head)
+        self.snake.appendleft(new_head)
+        self.snake_set.add(new_head)
+        self.occupy_cell(new_head)
+        # New head, old head and the segment that just lost its brightness change glyph
+        self.dirty_cells.update(islice(self.snake, 4))
         
         # Check food
         if new_head == self.food:
@@ -338,98 +623,138 @@ class SnakeGame:
                 self.level += 1
             
             self.food = self.generate_food()
+            if self.food is None:
+                return False
+            self.dirty_cells.add(self.food)
         else:
-            self.snake.pop()
+            tail = self.snake.pop()
+            self.snake_set.discard(tail)
+            self.release_cell(tail)
+            self.dirty_cells.add(tail)
         
         return True
 
     def get_adjusted_speed(self):
         """Get speed adjusted for current direction to compensate for terminal character ratio"""
-        return self.base_speed * self.speed_ratios[self.direction]
+        return self.tick_speed
 
-    def draw_board(self):
-        TerminalUtils.clear_screen()
-        
-        # Create game board lines
-        board_lines = []
-        
-        # Enhanced header with more game info
-        score_text = Colors.color(f"Score: {self.score}", Colors.YELLOW + Colors.BOLD)
-        level_text = Colors.color(f"Level: {self.level}", Colors.CYAN + Colors.BOLD)
-        foods_text = Colors.color(f"Foods: {self.foods_eaten}", Colors.GREEN)
-        length_text = Colors.color(f"Length: {len(self.snake)}", Colors.MAGENTA)
-        quit_text = Colors.color("Q: Quit", Colors.RED + Colors.DIM)
-        
-        # Create multi-line header
-        header1 = f"| {score_text} | {level_text} | {foods_text} |"
-        header2 = f"| {length_text} | {quit_text} |"
-        
-        board_lines.append(header1)
-        board_lines.append(header2)
-        board_lines.append("+" + "=" * self.width + "+")
+    def set_direction(self, direction):
+        """Switch direction, caching its step and tick duration for the hot path"""
+        self.direction = direction
+        self.dy, self.dx = direction.value
+        self.tick_speed = self.base_speed * self.speed_ratios[direction]
+
+    def cell_glyph(self, pos):
+        """Encoded colored character for an interior board cell"""
+        if pos == self.snake[0]:  # Enhanced snake head
+            return GLYPHS['head_l5'] if self.level >= 5 else GLYPHS['head']
+        elif pos in self.snake_set:  # Enhanced snake body
+            if pos == self.snake[1] or pos == self.snake[2]:  # First few segments are brighter
+                return GLYPHS['body_bright']
+            return GLYPHS['body']
+        elif pos == self.food:  # Enhanced food with level-based effects
+            if self.level >= 3:
+                return RAINBOW_STAR[self.ticks % len(RAINBOW_STAR)]  # Animated rainbow food
+            return GLYPHS['food']
+        return GLYPHS['empty']
+
+    def static_frame(self):
+        """Clear the screen and lay out borders and empty board once per game"""
+        border = ("+" + "=" * self.width + "+").encode()
+        edge_row = b"|" + GLYPHS['corner'] + GLYPHS['wall'] * (self.width - 2) + GLYPHS['corner'] + b"|"
+        inner_row = b"|" + GLYPHS['wall'] + b" " * (self.width - 2) + GLYPHS['wall'] + b"|"
         
-        # Game board with enhanced visuals
+        left = self.col_off - 2
+        parts = [b"\x1b[2J"]
+        parts.append(f"\x1b[{self.row_off - 1};{left + 1}H".encode() + border)
         for y in range(self.height):
-            row = "|"
-            for x in range(self.width):
-                if y == 0 or y == self.height - 1 or x == 0 or x == self.width - 1:
-                    # Enhanced wall design
-                    if (y == 0 or y == self.height - 1) and (x == 0 or x == self.width - 1):
-                        row += Colors.color("+", Colors.WHITE + Colors.BOLD)  # Corners
-                    else:
-                        row += Colors.color("#", Colors.GRAY)  # Walls
-                elif (y, x) == self.snake[0]:  # Enhanced snake head
-                    if self.level >= 5:
-                        row += Colors.color("@", Colors.GREEN + Colors.BG_GREEN + Colors.BOLD)
-                    else:
-                        row += Colors.color("@", Colors.GREEN + Colors.BOLD)
-                elif (y, x) in self.snake:  # Enhanced snake body
-                    snake_index = self.snake.index((y, x))
-                    if snake_index < 3:  # First few segments are brighter
-                        row += Colors.color("o", Colors.GREEN + Colors.BOLD)
-                    else:
-                        row += Colors.color("o", Colors.GREEN)
-                elif (y, x) == self.food:  # Enhanced food with level-based effects
-                    if self.level >= 3:
-                        row += Colors.rainbow_text("*")  # Rainbow food at higher levels
-                    else:
-                        row += Colors.color("*", Colors.RED + Colors.BOLD)
-                else:
-                    row += " "
-            row += "|"
-            board_lines.append(row)
+            row = edge_row if y == 0 or y == self.height - 1 else inner_row
+            parts.append(f"\x1b[{self.row_off + y};{left + 1}H".encode() + row)
+        parts.append(f"\x1b[{self.row_off + self.height};{left + 1}H".encode() + border)
+        return b"".join(parts)
+
+    def header_line(self, index, values):
+        """Cursor-addressed, centered header line filled with the given values"""
+        template, base_len = HEADER_LINES[index]
+        line = template.format(*values)
+        line_len = base_len + sum(len(str(value)) for value in values)
+        centered_line = TerminalUtils.center_line(line, line_len, self.term_width)
+        return f"\x1b[{self.board_top + index};1H\x1b[2K{centered_line}".encode()
+
+    def draw_board(self):
+        """Redraw only the screen regions that changed since the last frame"""
+        emit = self.emit
+        if self.sync_output:
+            emit(SYNC_BEGIN)
+        frame_start = self.frame_len
+        if self.layout_dirty:
+            self.layout_dirty = False
+            self.reset_layout()
+        if not self.screen_ready:
+            emit(self.static_frame())
+            self.screen_ready = True
         
-        # Enhanced footer with tips
-        board_lines.append("+" + "=" * self.width + "+")
+        # Enhanced header with more game info; each line is rewritten only when its values change
+        header1 = (self.score, self.level, self.foods_eaten)
+        if header1 != self.last_header1:
+            self.last_header1 = header1
+            emit(self.header_line(0, header1))
+        header2 = (len(self.snake),)
+        if header2 != self.last_header2:
+            self.last_header2 = header2
+            emit(self.header_line(1, header2))
+        
+        # Board cells that may have changed: old tail, new head, food, ...
+        self.dirty_cells.add(self.food)
+        for pos in self.dirty_cells:
+            y, x = pos
+            glyph = self.cell_glyph(pos)
+            if self.prev_cells[y][x] != glyph:
+                self.prev_cells[y][x] = glyph
+                emit(self.cell_goto[y][x])
+                emit(glyph)
+        self.dirty_cells.clear()
         
         # Dynamic tips based on game state
         if self.level == 1 and self.foods_eaten == 0:
-            tip_text = "TIP: Eat food (*) to grow and score points!"
-            tip = Colors.color(tip_text, Colors.CYAN + Colors.DIM)
+            tip_index = 0
         elif self.level >= 3:
-            tip_text = "AWESOME: Rainbow food gives bonus points!"
-            tip = Colors.color(tip_text, Colors.MAGENTA + Colors.DIM)
+            tip_index = 1
         elif len(self.snake) > 10:
-            tip_text = "CAREFUL: Don't hit your own tail!"
-            tip = Colors.color(tip_text, Colors.YELLOW + Colors.DIM)
+            tip_index = 2
         else:
-            tip_text = "Arrow keys: Move | Q: Quit"
-            tip = Colors.color(tip_text, Colors.WHITE + Colors.DIM)
-        
-        # Center the footer text properly
-        tip_padding = max(0, (self.width - 2 - len(tip_text)) // 2)  # -2 for the border characters
-        footer = "|" + " " * tip_padding + tip + " " * (self.width - 2 - len(tip_text) - tip_padding) + "|"
-        board_lines.append(footer)
+            tip_index = 3
+        if tip_index != self.last_tip:
+            self.last_tip = tip_index
+            emit(self.footer_lines[tip_index])
         
-        # Add vertical centering
-        vertical_padding = max(0, (self.term_height - len(board_lines)) // 2 - 2)
-        for _ in range(vertical_padding):
-            print()
-        
-        # Center and print each line
-        for line in board_lines:
-            centered_line = TerminalUtils.center_text(line, self.term_width)
-            print(centered_line)
+        if self.frame_len > frame_start:
+            if self.sync_output:
+                emit(SYNC_END)
+            self.flush_frame()
+        else:
+            self.frame_len = 0  # Nothing changed; drop the unused sync marker
+
+    def flush_frame(self):
+        """Write the assembled frame with a single syscall and reset the buffer"""
+        if self.out_fd is None:
+            sys.stdout.write(self.frame_buf[:self.frame_len].decode())
+            sys.stdout.flush()
+        else:
+            sys.stdout.flush()  # Keep ordering with anything already printed
+            with memoryview(self.frame_buf)[:self.frame_len] as frame:
+                written = os.write(self.out_fd, frame)
+                while written < len(frame):  # Large frames may be written partially
+                    written += os.write(self.out_fd, frame[written:])
+        self.frame_len = 0
+
+    def emit(self, data):
+        """Append bytes to the frame buffer, growing it only when it is full"""
+        end = self.frame_len + len(data)
+        if end > len(self.frame_buf):
+            self.frame_buf.extend(bytes(max(end, 2 * len(self.frame_buf)) - len(self.frame_buf)))
+        self.frame_buf[self.frame_len:end] = data
+        self.frame_len = end
 
     def wall_collision_effect(self, collision_pos):
         """Show explosion effect when hitting wall"""
@@ -443,178 +768,184 @@ class SnakeGame:
         
         explosion_colors = [Colors.RED, Colors.YELLOW, Colors.WHITE, Colors.YELLOW, Colors.RED]
         
+        # Every line is width + 2 columns wide, so one left padding centers the frame
+        pad = ' ' * max(0, (self.term_width - (self.width + 2)) // 2)
+        border = "+" + "=" * self.width + "+"
+        crash_title = "|" + " " * ((self.width - 8) // 2) + "CRASH!!!" + " " * (self.width - 8 - (self.width - 8) // 2) + "|"
+        head = Colors.color("X", Colors.RED + Colors.BOLD)
+        body = Colors.color("~", Colors.RED + Colors.DIM)
+        
         for frame_idx, frame in enumerate(explosion_frames):
-            TerminalUtils.clear_screen()
-            
             # Show the explosion at collision point
-            board_lines = []
+            board_lines = [border, crash_title, border]
             
-            # Header
-            header1 = "+" + "=" * self.width + "+"
-            header2 = "|" + " " * ((self.width - 8) // 2) + "CRASH!!!" + " " * (self.width - 8 - (self.width - 8) // 2) + "|"
-            board_lines.append(header1)
-            board_lines.append(header2)
-            board_lines.append("+" + "=" * self.width + "+")
+            # Flash walls during explosion; border rows are built once per frame
+            if frame_idx % 2 == 0:
+                wall = Colors.color("#", Colors.BG_RED + Colors.WHITE + Colors.BOLD)
+            else:
+                wall = Colors.color("#", Colors.RED + Colors.BOLD)
+            wall_row = "|" + wall * self.width + "|"
+            if frame_idx < len(frame):
+                explosion_char = "*" if frame_idx % 2 == 0 else "+"
+                boom = Colors.color(explosion_char, explosion_colors[frame_idx] + Colors.BOLD + Colors.BLINK)
+            else:
+                boom = " "
             
             # Game board with explosion effect
-            for y in range(self.height):
-                row = "|"
-                for x in range(self.width):
-                    if y == 0 or y == self.height - 1 or x == 0 or x == self.width - 1:
-                        # Flash walls during explosion
-                        wall_char = "#"
-                        if frame_idx % 2 == 0:
-                            row += Colors.color(wall_char, Colors.BG_RED + Colors.WHITE + Colors.BOLD)
-                        else:
-                            row += Colors.color(wall_char, Colors.RED + Colors.BOLD)
-                    elif (y, x) in self.snake:
+            board_lines.append(wall_row)
+            for y in range(1, self.height - 1):
+                cells = ["|", wall]
+                for x in range(1, self.width - 1):
+                    if (y, x) in self.snake_set:
                         # Show damaged snake
-                        if (y, x) == self.snake[0]:
-                            row += Colors.color("X", Colors.RED + Colors.BOLD)
-                        else:
-                            row += Colors.color("~", Colors.RED + Colors.DIM)
+                        cells.append(head if (y, x) == self.snake[0] else body)
                     elif abs(y - collision_pos[0]) <= 1 and abs(x - collision_pos[1]) <= 1:
                         # Show explosion around collision point
-                        if frame_idx < len(frame) and abs(y - collision_pos[0]) < len(frame):
-                            explosion_char = "*" if frame_idx % 2 == 0 else "+"
-                            row += Colors.color(explosion_char, explosion_colors[frame_idx] + Colors.BOLD + Colors.BLINK)
-                        else:
-                            row += " "
+                        cells.append(boom)
                     else:
-                        row += " "
-                row += "|"
-                board_lines.append(row)
-            
-            board_lines.append("+" + "=" * self.width + "+")
+                        cells.append(" ")
+                cells.append(wall)
+                cells.append("|")
+                board_lines.append("".join(cells))
+            board_lines.append(wall_row)
+            board_lines.append(border)
             
-            # Center and print
+            # Center and write the whole frame at once
             vertical_padding = max(0, (self.term_height - len(board_lines)) // 2 - 2)
-            for _ in range(vertical_padding):
-                print()
-            
-            for line in board_lines:
-                centered_line = TerminalUtils.center_text(line, self.term_width)
-                print(centered_line)
+            frame_text = "\n".join(pad + line for line in board_lines)
+            sys.stdout.write(_CLEAR + "\n" * vertical_padding + frame_text + "\n")
+            sys.stdout.flush()
             
             time.sleep(0.2)  # Animation speed
 
     def game_over(self):
-        TerminalUtils.clear_screen()
-        
         # Enhanced game over screen with stats
-        box_width = 50
-        
-        # Create game over title with effects
-        if self.score >= 100:
-            title_text = "GAME OVER!"
-            title = Colors.rainbow_text(title_text)
-        else:
-            title_text = "GAME OVER!"
-            title = Colors.color(title_text, Colors.RED + Colors.BOLD)
+        title = GAME_OVER_TITLES[self.score >= 100]
         
         # Performance evaluation
-        if self.score >= 200:
-            perf_text = "INCREDIBLE SCORE!"
-            performance = Colors.color(perf_text, Colors.YELLOW + Colors.BOLD)
-        elif self.score >= 100:
-            perf_text = "Great job!"
-            performance = Colors.color(perf_text, Colors.GREEN + Colors.BOLD)
-        elif self.score >= 50:
-            perf_text = "Not bad!"
-            performance = Colors.color(perf_text, Colors.CYAN)
-        else:
-            perf_text = "Keep practicing!"
-            performance = Colors.color(perf_text, Colors.BLUE)
-        
-        # Create all text lines first
-        stats = [
-            f"Final Score: {self.score} points",
-            f"Level Reached: {self.level}",
-            f"Foods Eaten: {self.foods_eaten}",
-            f"Snake Length: {len(self.snake)}"
-        ]
-        
-        restart_text = "Press 'y' to play again, 'n' to quit"
-        
-        # Build the box with proper centering
-        game_over_lines = []
-        
-        # Top border
-        game_over_lines.append("+" + "=" * box_width + "+")
-        
-        # Title line with proper centering
-        title_padding = (box_width - len(title_text)) // 2
-        title_line = "|" + " " * title_padding + title + " " * (box_width - len(title_text) - title_padding) + "|"
-        game_over_lines.append(title_line)
-        
-        # Separator
-        game_over_lines.append("+" + "-" * box_width + "+")
-        
-        # Empty line
-        game_over_lines.append("|" + " " * box_width + "|")
-        
-        # Stats lines
-        for stat in stats:
-            game_over_lines.append("|" + stat.center(box_width) + "|")
-        
-        # Empty line
-        game_over_lines.append("|" + " " * box_width + "|")
-        
-        # Performance line with proper centering
-        perf_padding = (box_width - len(perf_text)) // 2
-        perf_line = "|" + " " * perf_padding + performance + " " * (box_width - len(perf_text) - perf_padding) + "|"
-        game_over_lines.append(perf_line)
-        
-        # Empty line
-        game_over_lines.append("|" + " " * box_width + "|")
-        
-        # Restart instruction
-        game_over_lines.append("|" + restart_text.center(box_width) + "|")
-        
-        # Bottom border
-        game_over_lines.append("+" + "=" * box_width + "+")
-        
-        # Add vertical centering
-        vertical_padding = max(0, (self.term_height - len(game_over_lines)) // 2)
-        for _ in range(vertical_padding):
-            print()
+        for min_score, performance in GAME_OVER_VERDICTS:
+            if self.score >= min_score:
+                break
         
-        # Center and print each line
-        for line in game_over_lines:
-            centered_line = TerminalUtils.center_text(line, self.term_width)
-            print(centered_line)
+        # Every line of the box has the same width, so one left padding centers it
+        pad = ' ' * max(0, (self.term_width - (GAME_OVER_WIDTH + 2)) // 2)
+        vertical_padding = max(0, (self.term_height - GAME_OVER_TMPL.count('\n') - 1) // 2)
+        screen = GAME_OVER_TMPL.format(
+            pad=pad,
+            w=GAME_OVER_WIDTH,
+            title=title,
+            score=f"Final Score: {self.score} points",
+            level=f"Level Reached: {self.level}",
+            foods=f"Foods Eaten: {self.foods_eaten}",
+            length=f"Snake Length: {len(self.snake)}",
+            performance=performance
+        )
+        sys.stdout.write(_CLEAR + '\n' * vertical_padding + screen + '\n')
+        sys.stdout.flush()
 
     def cleanup(self):
         """Cross-platform terminal cleanup"""
+        self.leave_game_screen()
         if UNIX_TERMINAL and self.old_settings is not None:
             try:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
             except:
                 pass
         # Windows doesn't need special cleanup for msvcrt
+        
+        if self.old_winch_handler is not None:
+            signal.signal(signal.SIGWINCH, self.old_winch_handler)
+            self.old_winch_handler = None
+
+    def enter_game_screen(self):
+        """Switch to the alternate screen and hide the cursor for the whole game"""
+        sys.stdout.write("\x1b[?1049h\x1b[?25l")
+        sys.stdout.flush()
+        self.game_screen = True
+
+    def leave_game_screen(self):
+        """Restore the cursor and the user's original screen"""
+        if self.game_screen:
+            sys.stdout.write("\x1b[?25h\x1b[?1049l")
+            sys.stdout.flush()
+            self.game_screen = False
+
+    def wait_for_input(self, timeout):
+        """Wait up to timeout seconds for a key; returns True if input should be read"""
+        if WINDOWS_TERMINAL:
+            # msvcrt cannot block with a timeout, so poll it at a fine granularity
+            deadline = time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(0.01, remaining))
+            return True
+        elif UNIX_TERMINAL:
+            if self.input_closed:
+                time.sleep(timeout)
+                return False
+            try:
+                return self.input_ready(timeout)
+            except OSError:
+                return True
+        else:
+            time.sleep(timeout)
+            return True
+
+    def input_ready(self, timeout):
+        """Whether stdin becomes readable (or hits EOF) within timeout seconds"""
+        if self.poller is not None:
+            return bool(self.poller.poll(timeout * 1000))
+        return bool(select.select([self.in_fd], [], [], timeout)[0])
 
     def run(self):
+        # Terminal size is cached and only re-read when the terminal reports a resize
+        if hasattr(signal, 'SIGWINCH'):
+            try:
+                self.old_winch_handler = signal.signal(signal.SIGWINCH, self.on_resize)
+            except ValueError:
+                pass  # Not running in the main thread
+        
         try:
+            self.enter_game_screen()
+            self.draw_board()
+            # Block in select until a key arrives or the next tick is due
+            next_tick = time.monotonic() + self.get_adjusted_speed()
             while self.running:
-                self.draw_board()
-                self.handle_input()
+                timeout = next_tick - time.monotonic()
+                if timeout > _JAM:
+                    if self.wait_for_input(timeout - _JAM):
+                        self.handle_input()
+                    continue
+                while time.monotonic() < next_tick:
+                    pass
                 
                 if not self.move_snake():
                     break
                 
                 # Use direction-adjusted speed
-                adjusted_speed = self.get_adjusted_speed()
-                time.sleep(adjusted_speed)
+                tick_speed = self.get_adjusted_speed()
+                next_tick += tick_speed
+                now = time.monotonic()
+                if now < next_tick:
+                    self.draw_board()
+                elif now - next_tick > tick_speed:
+                    # Far behind (e.g. the process was suspended): resume from now
+                    # rather than replaying the missed ticks
+                    next_tick = now + tick_speed
+                    self.draw_board()
+                # Otherwise skip this frame to catch up; its dirty cells go out with the next one
             
+            # The results stay visible on the normal screen after the game
+            self.leave_game_screen()
             self.game_over()
             
         finally:
             self.cleanup()
 
-def show_logo():
-    term_width, term_height = TerminalUtils.get_terminal_size()
-    
-    logo_text = """
+# Title screen and difficulty menu; only their centering depends on the terminal
+LOGO_TEXT = """
 +===============================================+
 |                 SNAKE GAME                    |
 |              Terminal Edition                 |
@@ -626,61 +957,55 @@ def show_logo():
 |  Arrow Keys: Move  |  Q: Quit                 |
 +===============================================+
 """
+LOGO_HEIGHT = len(LOGO_TEXT.strip().split('\n'))
+
+DIFFICULTY_MENU = (
+    "",
+    "Select Difficulty:",
+    "1. Easy   (Dynamic size, Slow)",
+    "2. Medium (Dynamic size, Normal)",
+    "3. Hard   (Dynamic size, Fast)",
+    "4. Quit",
+    "",
+)
+DIFFICULTY_PROMPT = "Choice (1-4): "
+# Menu choice -> difficulty; None quits
+DIFFICULTY_CHOICES = {'1': 'easy', '2': 'medium', '3': 'hard', '4': None}
+
+def show_logo(term_width=None, term_height=None):
+    """Clear the screen and draw the centered logo"""
+    if term_width is None or term_height is None:
+        term_width, term_height = TerminalUtils.get_terminal_size()
     
     # Center the logo
-    centered_logo = TerminalUtils.center_text(logo_text, term_width)
+    centered_logo = TerminalUtils.center_text(LOGO_TEXT, term_width)
     
     # Add vertical centering
-    logo_lines = logo_text.strip().split('\n')
-    vertical_padding = max(0, (term_height - len(logo_lines)) // 2 - 3)
-    
-    TerminalUtils.clear_screen()
-    for _ in range(vertical_padding):
-        print()
+    vertical_padding = max(0, (term_height - LOGO_HEIGHT) // 2 - 3)
     
-    print(centered_logo)
+    # Clear, padding and logo go out in a single write
+    sys.stdout.write(_CLEAR + '\n' * vertical_padding + centered_logo + '\n')
+    sys.stdout.flush()
 
 def select_difficulty():
     while True:
         term_width, term_height = TerminalUtils.get_terminal_size()
-        TerminalUtils.clear_screen()
-        show_logo()
-        
-        # Create difficulty menu
-        menu_lines = [
-            "",
-            "Select Difficulty:",
-            "1. Easy   (Dynamic size, Slow)",
-            "2. Medium (Dynamic size, Normal)",  
-            "3. Hard   (Dynamic size, Fast)",
-            "4. Quit",
-            "",
-            "Choice (1-4): "
-        ]
+        show_logo(term_width, term_height)  # Also clears the screen
         
-        # Center the menu
-        for line in menu_lines[:-1]:  # All except the input prompt
-            centered_line = TerminalUtils.center_text(line, term_width)
-            print(centered_line)
+        # Center the menu and write it at once
+        centered_menu = TerminalUtils.center_block(DIFFICULTY_MENU, term_width)
+        sys.stdout.write('\n'.join(centered_menu) + '\n')
         
         # Center the input prompt
-        prompt_line = menu_lines[-1]
-        prompt_padding = (term_width - len(prompt_line)) // 2
-        choice = input(' ' * prompt_padding + prompt_line).strip()
-        
-        if choice == '1':
-            return 'easy'
-        elif choice == '2':
-            return 'medium'
-        elif choice == '3':
-            return 'hard'
-        elif choice == '4':
-            return None
-        else:
-            error_msg = "Invalid choice! Press Enter to try again..."
-            centered_error = TerminalUtils.center_text(error_msg, term_width)
-            print(centered_error)
-            input()
+        prompt_padding = (term_width - len(DIFFICULTY_PROMPT)) // 2
+        choice = input(' ' * prompt_padding + DIFFICULTY_PROMPT).strip()
+        
+        if choice in DIFFICULTY_CHOICES:
+            return DIFFICULTY_CHOICES[choice]
+        error_msg = "Invalid choice! Press Enter to try again..."
+        centered_error = TerminalUtils.center_text(error_msg, term_width)
+        print(centered_error)
+        input()
 
 def main():
     """Main game loop"""
@@ -691,13 +1016,19 @@ def main():
         print("A modern terminal-based snake game with enhanced features")
         return
     
+    TerminalUtils.enable_ansi()
+    game = None
     try:
         while True:
             difficulty = select_difficulty()
             if not difficulty:
                 break
                 
-            game = SnakeGame(difficulty)
+            # One game object serves every round; reset() only rebuilds the game state
+            if game is None:
+                game = SnakeGame(difficulty)
+            else:
+                game.reset(difficulty)
             game.run()
             
             # Ask for restart with centered text